@@ -9,15 +9,303 @@ across multiple carriers (UPS, USPS, DHL).
 import os
 import logging
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
 import time
+import random
 import re
+import itertools
+import threading
+import functools
+from collections import OrderedDict, defaultdict, deque
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from abc import ABC, abstractmethod
-from datetime import datetime
+from dataclasses import dataclass
+from typing import Optional
+from datetime import datetime, timedelta
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Scheduled delivery date embedded in UPS status text (MM/DD/YY or MM/DD/YYYY)
+_UPS_DATE_RE = re.compile(r'(\d{1,2}/\d{1,2}/\d{2,4})')
+
+# Case-insensitive "scheduled delivery" marker in UPS status text
+_SCHED_RE = re.compile(r'scheduled delivery', re.IGNORECASE)
+
+# Month names indexed by month number - 1
+_MONTH_NAMES = ("January", "February", "March", "April", "May", "June",
+                "July", "August", "September", "October", "November", "December")
+
+# UPS transaction IDs: process-start prefix plus a per-request sequence number
+_TRANS_PREFIX = f"{int(time.time()):x}"
+_TRANS_SEQ = itertools.count()
+
+# (12-hour clock hour, AM/PM) for every two-digit 24-hour value
+_HOUR12 = tuple((hour % 12 or 12, 'PM' if hour >= 12 else 'AM') for hour in range(100))
+
+# Common DHL timestamp shape: YYYY-MM-DDTHH:MM[:SS[.ffffff]][Z|+HH:MM]
+_DHL_TIMESTAMP_RE = re.compile(
+    r'([0-9]{4})-([0-9]{2})-([0-9]{2})T([0-9]{2}):([0-5][0-9])'
+    r'(?::[0-5][0-9](?:\.[0-9]{1,6})?)?(?:Z|[+-](?:[01][0-9]|2[0-3]):[0-5][0-9])?'
+)
+
+# Shared read-only default for nested .get() lookups (never mutate)
+_EMPTY_DICT = {}
+
+# Mock tracking statuses, in shipment progress order
+_USPS_MOCK_STATUSES = (
+    "Accepted at USPS Origin Facility",
+    "Departed USPS Regional Facility",
+    "Arrived at USPS Regional Facility",
+    "In Transit to Next Facility",
+    "Out for Delivery",
+    "Delivered, In/At Mailbox"
+)
+_DHL_MOCK_STATUSES = (
+    "Shipment picked up",
+    "Processed at DHL Location",
+    "Departed Facility",
+    "In Transit",
+    "Arrived at Delivery Facility",
+    "With Delivery Courier",
+    "Delivered"
+)
+
+# Mock tracking locations as (city, state) and (city, country, country code) records
+_USPS_MOCK_LOCATIONS = (
+    ("New York", "NY"),
+    ("Chicago", "IL"),
+    ("Los Angeles", "CA"),
+    ("Houston", "TX"),
+    ("Miami", "FL"),
+    ("Denver", "CO"),
+    ("Seattle", "WA")
+)
+_DHL_MOCK_LOCATIONS = (
+    ("Berlin", "Germany", "DE"),
+    ("Frankfurt", "Germany", "DE"),
+    ("London", "United Kingdom", "GB"),
+    ("Paris", "France", "FR"),
+    ("Madrid", "Spain", "ES"),
+    ("Rome", "Italy", "IT"),
+    ("Amsterdam", "Netherlands", "NL")
+)
+
+# Constant fields of the UPS Time in Transit request; copy before filling in per-call values
+_TRANSIT_BODY_TEMPLATE = {
+    "originCountryCode": "US",
+    "originStateProvince": "",
+    "originCityName": "",
+    "originTownName": "",
+    "originPostalCode": "",
+    "destinationCountryCode": "US",
+    "destinationStateProvince": "",
+    "destinationCityName": "",
+    "destinationTownName": "",
+    "destinationPostalCode": "",
+    "weight": "1.0",
+    "weightUnitOfMeasure": "LBS",
+    "shipmentContentsValue": "1.0",
+    "shipmentContentsCurrencyCode": "USD",
+    "billType": "03",
+    "shipDate": "",
+    "shipTime": "",
+    "residentialIndicator": "",
+    "numberOfPackages": "1"
+}
+
+# Today's ship date string, reformatted only once the local day rolls over
+_ship_date_cache = {'date': '', 'expires_at': 0.0}
+
+def _today_str():
+    """
+    Get today's local date in YYYY-MM-DD format, cached until midnight.
+    
+    Returns:
+        str: Today's date string
+    """
+    if time.time() >= _ship_date_cache['expires_at']:
+        today = datetime.now().date()
+        tomorrow = datetime.combine(today + timedelta(days=1), datetime.min.time())
+        _ship_date_cache['date'] = today.strftime("%Y-%m-%d")
+        _ship_date_cache['expires_at'] = tomorrow.timestamp()
+    return _ship_date_cache['date']
+
+# Recent latency samples (seconds) per UPS operation, for spotting the slowest stage
+LATENCY_SAMPLE_SIZE = 1000
+_LATENCY = defaultdict(lambda: deque(maxlen=LATENCY_SAMPLE_SIZE))
+
+@contextmanager
+def _timed(op):
+    """Record the wall-clock duration of the enclosed block under op."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _LATENCY[op].append(time.perf_counter() - start)
+
+def get_latency_report():
+    """
+    Summarize recorded UPS API latencies.
+    
+    Returns:
+        dict: Operation name mapped to count, mean, p50, p95 and max in milliseconds
+    """
+    report = {}
+    for op, samples in list(_LATENCY.items()):
+        ordered = sorted(samples)
+        if not ordered:
+            continue
+        count = len(ordered)
+        report[op] = {
+            'count': count,
+            'mean_ms': sum(ordered) / count * 1000,
+            'p50_ms': ordered[count // 2] * 1000,
+            'p95_ms': ordered[min(count - 1, int(count * 0.95))] * 1000,
+            'max_ms': ordered[-1] * 1000
+        }
+    return report
+
+def _response_body(response, limit=500):
+    """
+    Decode an error response body for logging without requests' charset detection.
+    
+    Args:
+        response (requests.Response): Response whose body should be logged
+        limit (int): Maximum number of bytes to include
+        
+    Returns:
+        str: Body text, truncated to limit bytes
+    """
+    return response.content[:limit].decode('utf-8', 'replace')
+
+def _format_time_12h(hour, minute):
+    """
+    Format a 24-hour clock time as 12-hour time with AM/PM.
+    
+    Args:
+        hour (int): Hour from the carrier timestamp (0-99)
+        minute (str): Two-digit minute string
+        
+    Returns:
+        str: Time like "9:51 AM"
+    """
+    hour_12, am_pm = _HOUR12[hour]
+    return f"{hour_12}:{minute} {am_pm}"
+
+@functools.lru_cache(maxsize=2048)
+def format_ups_date(date_str):
+    """
+    Format a UPS date string to be human-readable.
+    Converts YYYYMMDD like "20250418" and MM/DD/YY like "4/18/25" to "April 18, 2025";
+    other values are returned as-is.
+    
+    Args:
+        date_str (str): UPS format date string
+        
+    Returns:
+        str: Human-readable date string
+    """
+    if not date_str:
+        return date_str
+    if len(date_str) >= 8 and date_str.isdecimal():
+        # Decode YYYYMMDD with one int() and split it arithmetically
+        year, month_day = divmod(int(date_str[:8]), 10000)
+        month, day = divmod(month_day, 100)
+        if 1 <= month <= 12:
+            return f"{_MONTH_NAMES[month - 1]} {day}, {year:04d}"
+    elif '/' in date_str and _UPS_DATE_RE.fullmatch(date_str):
+        # Scheduled delivery dates in status text use MM/DD/YY or MM/DD/YYYY
+        month, day, year = date_str.split('/')
+        month = int(month)
+        if 1 <= month <= 12:
+            if len(year) == 2:
+                year = "20" + year  # Assume 21st century
+            return f"{_MONTH_NAMES[month - 1]} {int(day)}, {year}"
+    return date_str
+
+@functools.lru_cache(maxsize=2048)
+def format_ups_time(time_str):
+    """
+    Format a UPS time string to be human-readable.
+    Converts HHMMSS like "095158" to "9:51 AM"; other values are returned as-is.
+    
+    Args:
+        time_str (str): UPS format time string (HHMMSS in 24h format)
+        
+    Returns:
+        str: Human-readable time string
+    """
+    if time_str and len(time_str) >= 6 and time_str.isdecimal():
+        return _format_time_12h(int(time_str[:2]), time_str[2:4])
+    return time_str
+
+@functools.lru_cache(maxsize=2048)
+def format_dhl_date(date_str):
+    """
+    Format a DHL ISO 8601 timestamp to be human-readable.
+    Converts "2025-04-18T09:51:58Z" to "April 18, 2025 at 09:51 AM".
+    
+    Args:
+        date_str (str): DHL timestamp (YYYY-MM-DDTHH:MM:SS, optionally with offset or Z)
+        
+    Returns:
+        str: Human-readable date string, 'Unknown' if empty, or the input if unparseable
+    """
+    try:
+        if not date_str:
+            return 'Unknown'
+        
+        # Fast path: slice the fields of the usual shape directly instead of building a datetime
+        match = _DHL_TIMESTAMP_RE.fullmatch(date_str)
+        if match:
+            year, month, day, hour = (int(field) for field in match.group(1, 2, 3, 4))
+            # Days past the 28th need calendar validation, so leave those to fromisoformat
+            if year and 1 <= month <= 12 and 1 <= day <= 28 and hour < 24:
+                hour_12, am_pm = _HOUR12[hour]
+                return f"{_MONTH_NAMES[month - 1]} {day:02d}, {year} at {hour_12:02d}:{match.group(5)} {am_pm}"
+        
+        # Parse ISO format
+        dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+        
+        # Format as human readable
+        return dt.strftime("%B %d, %Y at %I:%M %p")
+    except Exception as e:
+        logger.error("Error formatting DHL date %s: %s", date_str, e)
+        return date_str
+
+@dataclass(slots=True)
+class TrackingResult:
+    """Standardized tracking information returned by every carrier API."""
+    
+    tracking_data: Optional[dict] = None
+    status: Optional[str] = None
+    last_update: Optional[str] = None
+    location: Optional[str] = None
+    address: Optional[dict] = None
+    delivery_estimate: Optional[str] = None
+    carrier: Optional[str] = None
+    
+    def to_dict(self):
+        """
+        Convert the result to a plain dict, e.g. for JSON serialization.
+        
+        Returns:
+            dict: Tracking information keyed by field name
+        """
+        return {
+            'tracking_data': self.tracking_data,
+            'status': self.status,
+            'last_update': self.last_update,
+            'location': self.location,
+            'address': self.address,
+            'delivery_estimate': self.delivery_estimate,
+            'carrier': self.carrier
+        }
+
 class CarrierAPI(ABC):
     """Abstract base class for carrier APIs."""
     
@@ -30,7 +318,7 @@ class CarrierAPI(ABC):
             tracking_number (str): The tracking number to track
             
         Returns:
-            dict: Standardized tracking information
+            TrackingResult: Standardized tracking information
         """
         pass
     
@@ -103,21 +391,73 @@ class CarrierAPI(ABC):
             carrier_name (str): Name of the carrier
             
         Returns:
-            dict: Standardized tracking information
+            TrackingResult: Standardized tracking information
         """
-        return {
-            'tracking_data': tracking_data,
-            'status': status,
-            'last_update': last_update,
-            'location': location,
-            'address': address,
-            'delivery_estimate': delivery_estimate,
-            'carrier': carrier_name or self.get_carrier_name()
-        }
+        return TrackingResult(
+            tracking_data,
+            status,
+            last_update,
+            location,
+            address,
+            delivery_estimate,
+            carrier_name or self.get_carrier_name()
+        )
     
     def get_carrier_name(self):
         """Get the name of the carrier."""
         return self.__class__.__name__.replace('Api', '')
+    
+    def _prepare_batch(self):
+        """Hook run once before a batch of lookups; carriers override it to warm shared state."""
+        pass
+    
+    def get_tracking_info_many(self, tracking_numbers, max_workers=10):
+        """
+        Get tracking information for several packages concurrently.
+        
+        Args:
+            tracking_numbers (list): Tracking numbers to look up
+            max_workers (int): Maximum number of requests in flight at once
+            
+        Returns:
+            list: TrackingResult objects, in the same order as tracking_numbers
+        """
+        if not tracking_numbers:
+            return []
+        
+        self._prepare_batch()
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.get_tracking_info, tracking_numbers))
+    
+    @classmethod
+    def track_many(cls, carrier_to_numbers, max_workers=10):
+        """
+        Get tracking information across carriers using one shared thread pool.
+        
+        Args:
+            carrier_to_numbers (dict): Carrier name mapped to a list of tracking numbers
+            max_workers (int): Maximum number of requests in flight at once
+            
+        Returns:
+            dict: Carrier name mapped to a list of TrackingResult objects, in input order
+        """
+        apis = {}
+        for carrier_name, tracking_numbers in carrier_to_numbers.items():
+            if tracking_numbers:
+                api = create_carrier_api(carrier_name)
+                api._prepare_batch()
+                apis[carrier_name] = api
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                carrier_name: [executor.submit(api.get_tracking_info, tn) for tn in carrier_to_numbers[carrier_name]]
+                for carrier_name, api in apis.items()
+            }
+            return {
+                carrier_name: [future.result() for future in carrier_futures]
+                for carrier_name, carrier_futures in futures.items()
+            }
 
 class UPSApi(CarrierAPI):
     """UPS API implementation."""
@@ -128,10 +468,38 @@ class UPSApi(CarrierAPI):
     UPS_ADDRESS_URL = 'https://onlinetools.ups.com/api/addressvalidation/v1/1'
     UPS_TIME_IN_TRANSIT_URL = 'https://onlinetools.ups.com/api/timeintransit/v1'
     
+    # Refresh the OAuth token this many seconds before UPS expires it
+    TOKEN_EXPIRY_MARGIN = 30
+    
+    # OAuth token shared by every UPSApi instance in the process
+    _token_cache = {'token': None, 'expires_at': 0.0}
+    _token_lock = threading.Lock()
+    
+    # Recently fetched tracking results, reused for repeat polls within the TTL
+    TRACK_CACHE_TTL = 60
+    TRACK_CACHE_SIZE = 1000
+    _track_cache = OrderedDict()  # tracking number -> (expires_at, TrackingResult)
+    _track_cache_lock = threading.Lock()
+    
     def __init__(self):
         """Initialize the UPS API client."""
         self.access_token = None
         
+        # Pooled session so repeated calls reuse the kept-alive connection to UPS
+        self.session = requests.Session()
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        self.session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retries))
+    
+    def close(self):
+        """Close the pooled HTTP session."""
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
     def get_oauth_token(self):
         """Get OAuth token from UPS API."""
         try:
@@ -141,12 +509,12 @@ class UPSApi(CarrierAPI):
             # Log credential information (mask most of it for security)
             if client_id:
                 masked_id = client_id[:4] + '*' * (len(client_id) - 4) if len(client_id) > 4 else '****'
-                logger.info(f"Using UPS Client ID: {masked_id}")
+                logger.info("Using UPS Client ID: %s", masked_id)
             else:
                 logger.error("UPS_CLIENT_ID is empty or not set")
                 
             if client_secret:
-                logger.info(f"UPS Client Secret is set (length: {len(client_secret)})")
+                logger.info("UPS Client Secret is set (length: %s)", len(client_secret))
             else:
                 logger.error("UPS_CLIENT_SECRET is empty or not set")
             
@@ -163,51 +531,95 @@ class UPSApi(CarrierAPI):
             logger.info("Sending UPS OAuth token request...")
             
             # Make the request
-            response = requests.post(
-                self.UPS_OAUTH_URL,
-                headers=headers,
-                data=data,
-                auth=(client_id, client_secret)
-            )
+            with _timed('oauth'):
+                response = self.session.post(
+                    self.UPS_OAUTH_URL,
+                    headers=headers,
+                    data=data,
+                    auth=(client_id, client_secret)
+                )
             
-            logger.info(f"UPS OAuth response status code: {response.status_code}")
+            logger.info("UPS OAuth response status code: %s", response.status_code)
             
             if response.status_code == 200:
-                token_data = response.json()
+                token_data = orjson.loads(response.content)
                 access_token = token_data.get('access_token')
                 expires_in = token_data.get('expires_in', 'unknown')
-                logger.info(f"Successfully obtained UPS OAuth token (expires in {expires_in} seconds)")
+                logger.info("Successfully obtained UPS OAuth token (expires in %s seconds)", expires_in)
                 
                 # Mask token for security in logs
                 if access_token:
                     masked_token = access_token[:10] + '*' * 10 + access_token[-5:] if len(access_token) > 25 else '****'
-                    logger.info(f"UPS Token: {masked_token}")
+                    logger.info("UPS Token: %s", masked_token)
                     self.access_token = access_token
+                    
+                    # Cache the token until shortly before it expires
+                    try:
+                        lifetime = int(expires_in)
+                    except (TypeError, ValueError):
+                        lifetime = 0
+                    UPSApi._token_cache['token'] = access_token
+                    UPSApi._token_cache['expires_at'] = time.time() + lifetime - self.TOKEN_EXPIRY_MARGIN
                     return access_token
                 else:
                     logger.error("UPS Access token not found in response")
                     return None
             else:
-                logger.error(f"Failed to get UPS OAuth token: {response.status_code} - {response.text}")
+                logger.error("Failed to get UPS OAuth token: %s - %s", response.status_code, _response_body(response))
                 return None
         except Exception as e:
-            logger.error(f"Error obtaining UPS OAuth token: {e}")
+            logger.error("Error obtaining UPS OAuth token: %s", e)
             return None
     
+    def _get_valid_token(self):
+        """Return the cached OAuth token, requesting a new one if it has expired."""
+        with self._token_lock:
+            cache = UPSApi._token_cache
+            if cache['token'] and time.time() < cache['expires_at']:
+                self.access_token = cache['token']
+                return self.access_token
+            return self.get_oauth_token()
+    
+    def _get_cached_tracking(self, tracking_number):
+        """Return a cached tracking result that has not expired yet, or None."""
+        with self._track_cache_lock:
+            hit = UPSApi._track_cache.get(tracking_number)
+            if hit is None:
+                return None
+            if hit[0] <= time.time():
+                del UPSApi._track_cache[tracking_number]
+                return None
+            UPSApi._track_cache.move_to_end(tracking_number)
+            return hit[1]
+    
+    def _cache_tracking(self, tracking_number, result):
+        """Cache a tracking result, evicting the least recently used entries beyond the size cap."""
+        with self._track_cache_lock:
+            cache = UPSApi._track_cache
+            cache[tracking_number] = (time.time() + self.TRACK_CACHE_TTL, result)
+            cache.move_to_end(tracking_number)
+            while len(cache) > self.TRACK_CACHE_SIZE:
+                cache.popitem(last=False)
+    
     def get_tracking_info(self, tracking_number):
         """Get tracking information from UPS API."""
         try:
-            # Get OAuth token if not already present
-            if not self.access_token:
-                self.access_token = self.get_oauth_token()
+            # Reuse a recent result for repeat polls of the same package
+            cached = self._get_cached_tracking(tracking_number)
+            if cached is not None:
+                logger.info("Using cached UPS tracking info for %s", tracking_number)
+                return cached
+            
+            # Get a valid (cached or refreshed) OAuth token
+            access_token = self._get_valid_token()
                 
-            if not self.access_token:
+            if not access_token:
                 logger.error("No UPS access token available, cannot track package")
                 return self.standardize_response(None, status="API Error", carrier_name="UPS")
             
             # UPS Tracking API endpoint
             tracking_url = self.UPS_TRACK_URL + tracking_number
-            logger.info(f"Using UPS Tracking API URL: {tracking_url}")
+            logger.info("Using UPS Tracking API URL: %s", tracking_url)
             
             # Query parameters based on the example
             query_params = {
@@ -218,35 +630,37 @@ class UPSApi(CarrierAPI):
             }
             
             # Request headers
-            trans_id = f'track_{int(time.time())}'
+            trans_id = f"track_{_TRANS_PREFIX}_{next(_TRANS_SEQ):x}"
             headers = {
-                'Authorization': f'Bearer {self.access_token}',
+                'Authorization': f'Bearer {access_token}',
                 'Content-Type': 'application/json',
                 'transId': trans_id,
                 'transactionSrc': 'tracking'
             }
             
-            logger.info(f"Using UPS transaction ID: {trans_id}")
-            logger.info(f"Sending UPS tracking request for: {tracking_number}")
+            logger.info("Using UPS transaction ID: %s", trans_id)
+            logger.info("Sending UPS tracking request for: %s", tracking_number)
             
             # Make the request with query parameters
-            response = requests.get(
-                tracking_url, 
-                headers=headers,
-                params=query_params
-            )
+            with _timed('track'):
+                response = self.session.get(
+                    tracking_url, 
+                    headers=headers,
+                    params=query_params
+                )
             
-            logger.info(f"UPS Tracking API response status: {response.status_code}")
+            logger.info("UPS Tracking API response status: %s", response.status_code)
             
             if response.status_code == 200:
-                tracking_data = response.json()
-                logger.info(f"Successfully retrieved UPS tracking info for {tracking_number}")
+                tracking_data = orjson.loads(response.content)
+                logger.info("Successfully retrieved UPS tracking info for %s", tracking_number)
                 
                 # Parse the tracking response
-                status, last_update, location, address_dict, delivery_estimate = self.parse_tracking_response(tracking_data)
+                with _timed('parse'):
+                    status, last_update, location, address_dict, delivery_estimate = self.parse_tracking_response(tracking_data)
                 
-                # Return standardized response
-                return self.standardize_response(
+                # Cache and return standardized response
+                result = self.standardize_response(
                     tracking_data, 
                     status=status, 
                     last_update=last_update, 
@@ -255,37 +669,43 @@ class UPSApi(CarrierAPI):
                     delivery_estimate=delivery_estimate,
                     carrier_name="UPS"
                 )
+                self._cache_tracking(tracking_number, result)
+                return result
             else:
-                logger.error(f"Failed to get UPS tracking info for {tracking_number}: {response.status_code} - {response.text}")
+                logger.error("Failed to get UPS tracking info for %s: %s - %s", tracking_number, response.status_code, _response_body(response))
                 return self.standardize_response(
                     None, 
                     status="API Error", 
                     carrier_name="UPS"
                 )
         except Exception as e:
-            logger.error(f"Error getting UPS tracking info for {tracking_number}: {e}")
+            logger.error("Error getting UPS tracking info for %s: %s", tracking_number, e)
             return self.standardize_response(
                 None, 
                 status="Error", 
                 carrier_name="UPS"
             )
     
+    def _prepare_batch(self):
+        """Fetch the OAuth token once up front so batch workers share it."""
+        self._get_valid_token()
+    
     def validate_address(self, address):
         """Validate address using UPS Address Validation API."""
         try:
-            # Get OAuth token if not already present
-            if not self.access_token:
-                self.access_token = self.get_oauth_token()
+            # Get a valid (cached or refreshed) OAuth token
+            access_token = self._get_valid_token()
                 
-            if not self.access_token:
+            if not access_token:
                 logger.error("No UPS access token available, cannot validate address")
                 return None
                 
             # Log the address we're trying to validate
-            logger.info(f"Attempting to validate address with UPS: {json.dumps(address)}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Attempting to validate address with UPS: %s", orjson.dumps(address).decode('utf-8'))
             
             # Check if we have enough address information to validate
-            if not any([address.get(key) for key in ["postal_code", "city", "state"]]):
+            if not (address.get("postal_code") or address.get("city") or address.get("state")):
                 logger.warning("Not enough address information for UPS validation")
                 return None
                 
@@ -300,9 +720,9 @@ class UPSApi(CarrierAPI):
             
             # Request headers
             headers = {
-                'Authorization': f'Bearer {self.access_token}',
+                'Authorization': f'Bearer {access_token}',
                 'Content-Type': 'application/json',
-                'transId': f'address_{int(time.time())}',
+                'transId': f"address_{_TRANS_PREFIX}_{next(_TRANS_SEQ):x}",
                 'transactionSrc': 'addressValidation'
             }
             
@@ -315,46 +735,51 @@ class UPSApi(CarrierAPI):
                 }
             }
             
-            logger.info(f"UPS Validation request data: {json.dumps(data)}")
+            # Serialize the body once and reuse it for both the log and the request
+            body = orjson.dumps(data)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("UPS Validation request data: %s", body.decode('utf-8'))
             
             # Make the request
-            response = requests.post(
-                self.UPS_ADDRESS_URL,
-                headers=headers,
-                json=data
-            )
+            with _timed('address'):
+                response = self.session.post(
+                    self.UPS_ADDRESS_URL,
+                    headers=headers,
+                    data=body
+                )
             
-            logger.info(f"UPS Address Validation API response status: {response.status_code}")
+            logger.info("UPS Address Validation API response status: %s", response.status_code)
             
             if response.status_code == 200:
-                validation_data = response.json()
-                logger.info(f"Successfully validated address with UPS")
+                validation_data = orjson.loads(response.content)
+                logger.info("Successfully validated address with UPS")
                 return validation_data
             else:
-                logger.error(f"Failed to validate address with UPS: {response.status_code} - {response.text}")
+                logger.error("Failed to validate address with UPS: %s - %s", response.status_code, _response_body(response))
                 return None
         except Exception as e:
-            logger.error(f"Error validating address with UPS: {e}")
+            logger.error("Error validating address with UPS: %s", e)
             return None
     
     def get_estimated_delivery(self, origin, destination):
         """Get estimated delivery time using UPS Time in Transit API."""
         try:
-            # Get OAuth token if not already present
-            if not self.access_token:
-                self.access_token = self.get_oauth_token()
+            # Get a valid (cached or refreshed) OAuth token
+            access_token = self._get_valid_token()
                 
-            if not self.access_token:
+            if not access_token:
                 logger.error("No UPS access token available, cannot get time in transit")
                 return None
                 
             # Log what we have
-            logger.info(f"UPS Origin data: {origin}")
-            logger.info(f"UPS Destination data: {destination}")
+            logger.info("UPS Origin data: %s", origin)
+            logger.info("UPS Destination data: %s", destination)
             
             # Check if we have the minimum required fields
-            origin_postal = origin.get("postal_code")
-            dest_postal = destination.get("postal_code")
+            origin_get = origin.get
+            dest_get = destination.get
+            origin_postal = origin_get("postal_code")
+            dest_postal = dest_get("postal_code")
             
             if not origin_postal:
                 logger.error("Missing origin postal code for UPS time in transit calculation")
@@ -366,284 +791,118 @@ class UPSApi(CarrierAPI):
                 
             # Request headers
             headers = {
-                'Authorization': f'Bearer {self.access_token}',
+                'Authorization': f'Bearer {access_token}',
                 'Content-Type': 'application/json',
-                'transId': f'time_{int(time.time())}',
+                'transId': f"time_{_TRANS_PREFIX}_{next(_TRANS_SEQ):x}",
                 'transactionSrc': 'tracking'
             }
             
             # Current date in YYYY-MM-DD format
-            ship_date = datetime.now().strftime("%Y-%m-%d")
-            
-            # Format the request exactly as in the example
-            data = {
-                "originCountryCode": origin.get("country", "US"),
-                "originStateProvince": origin.get("state", ""),
-                "originCityName": origin.get("city", ""),
-                "originTownName": "",
-                "originPostalCode": origin_postal,
-                "destinationCountryCode": destination.get("country", "US"),
-                "destinationStateProvince": destination.get("state", ""),
-                "destinationCityName": destination.get("city", ""),
-                "destinationTownName": "",
-                "destinationPostalCode": dest_postal,
-                "weight": "1.0",
-                "weightUnitOfMeasure": "LBS",
-                "shipmentContentsValue": "1.0",
-                "shipmentContentsCurrencyCode": "USD",
-                "billType": "03",
-                "shipDate": ship_date,
-                "shipTime": "",
-                "residentialIndicator": "",
-                "numberOfPackages": "1"
-            }
-            
-            logger.info(f"Requesting UPS time in transit estimate from {origin_postal} to {dest_postal}")
+            ship_date = _today_str()
+            
+            # Fill in the per-call fields of the request template
+            data = _TRANSIT_BODY_TEMPLATE.copy()
+            data["originCountryCode"] = origin_get("country", "US")
+            data["originStateProvince"] = origin_get("state", "")
+            data["originCityName"] = origin_get("city", "")
+            data["originPostalCode"] = origin_postal
+            data["destinationCountryCode"] = dest_get("country", "US")
+            data["destinationStateProvince"] = dest_get("state", "")
+            data["destinationCityName"] = dest_get("city", "")
+            data["destinationPostalCode"] = dest_postal
+            data["shipDate"] = ship_date
+            
+            logger.info("Requesting UPS time in transit estimate from %s to %s", origin_postal, dest_postal)
             
             # Use the correct endpoint URL based on the example
             transit_url = "https://onlinetools.ups.com/api/shipments/v1/transittimes"
             
             # Make the request
-            response = requests.post(
-                transit_url,
-                headers=headers,
-                json=data
-            )
+            with _timed('transit'):
+                response = self.session.post(
+                    transit_url,
+                    headers=headers,
+                    data=orjson.dumps(data)
+                )
             
-            logger.info(f"UPS Time in Transit API response status: {response.status_code}")
+            logger.info("UPS Time in Transit API response status: %s", response.status_code)
             
             if response.status_code == 200:
-                time_data = response.json()
-                logger.info(f"Successfully retrieved UPS time in transit information")
+                time_data = orjson.loads(response.content)
+                logger.info("Successfully retrieved UPS time in transit information")
                 return time_data
             else:
-                logger.error(f"Failed to get UPS time in transit: {response.status_code} - {response.text}")
+                logger.error("Failed to get UPS time in transit: %s - %s", response.status_code, _response_body(response))
                 return None
         except Exception as e:
-            logger.error(f"Error getting UPS time in transit: {e}")
+            logger.error("Error getting UPS time in transit: %s", e)
             return None
     
-        def parse_tracking_response(tracking_data):
-                """
-                Parse the UPS Tracking API response to extract relevant information.
-                Enhanced to specifically extract delivery date information with human-friendly formatting.
-                
-                Args:
-                    tracking_data: The API response from UPS
-                    
-                Returns:
-                    tuple: (status, last_update, location, address, delivery_estimate) or (None, None, None, None, None) if parsing fails
-                """
-        try:
-            if not tracking_data:
-                return None, None, None, None, None
-                
-            # Log the tracking data structure for debugging
-            logger.info(f"Parsing tracking data response")
-            
-            # Extract package information
-            shipment = tracking_data.get('trackResponse', {}).get('shipment', [{}])[0]
-            package = shipment.get('package', [{}])[0]
-            
-            # Get status
-            activity = package.get('activity', [{}])[0]
-            status = activity.get('status', {}).get('description', 'Unknown')
-            
-            # Get last update time - with better formatting
-            date = activity.get('date', '')
-            time_str = activity.get('time', '')
-            
-            # Format the date and time for readability
-            formatted_date = format_ups_date(date)
-            formatted_time = format_ups_time(time_str)
-            
-            if formatted_date and formatted_time:
-                last_update = f"{formatted_date} at {formatted_time}"
-            elif formatted_date:
-                last_update = formatted_date
-            else:
-                last_update = 'Unknown'
-            
-            # Get location
-            location_info = activity.get('location', {})
-            address = location_info.get('address', {})
-            
-            city = address.get('city', '')
-            state = address.get('stateProvince', '')
-            country = address.get('country', '')
-            postal_code = address.get('postalCode', '')
-            
-            location_parts = [part for part in [city, state, country] if part]
-            location = ', '.join(location_parts) if location_parts else 'Unknown'
-            
-            # Extract street address if available
-            street = ""
-            ship_to = shipment.get('shipTo', {})
-            if ship_to:
-                ship_to_address = ship_to.get('address', {})
-                if ship_to_address:
-                    street_lines = ship_to_address.get('addressLine', [])
-                    if isinstance(street_lines, list) and street_lines:
-                        street = street_lines[0]
-                    elif isinstance(street_lines, str):
-                        street = street_lines
-            
-            # Create address dict for validation
-            address_dict = {
-                "street": street,
-                "city": city,
-                "state": state,
-                "postal_code": postal_code,
-                "country": country
-            }
-            
-            # Extract delivery date information - primary focus
-            delivery_estimate = None
-            
-            # Check multiple places for delivery date information
-            
-            # 1. Check the deliveryDate object if present
-            delivery_dates = package.get('deliveryDate', [])
-            if delivery_dates:
-                for delivery_date_obj in delivery_dates:
-                    date = delivery_date_obj.get('date', '')
-                    type_code = delivery_date_obj.get('type', '')
-                    
-                    # Log what we found
-                    logger.info(f"Found delivery date: {date}, type: {type_code}")
-                    
-                    if date:
-                        # Format date to be human-readable
-                        formatted_delivery_date = format_ups_date(date)
-                        delivery_estimate = formatted_delivery_date
-                        break
-            
-            # 2. If not found, check deliveryTime object
-            if not delivery_estimate:
-                delivery_time = package.get('deliveryTime', {})
-                if delivery_time:
-                    date_type = delivery_time.get('type', '')
-                    start_time = delivery_time.get('startTime', '')
-                    end_time = delivery_time.get('endTime', '')
-                    
-                    logger.info(f"Found delivery time: type={date_type}, start={start_time}, end={end_time}")
-                    
-                    if date_type and (start_time or end_time):
-                        if date_type == 'EDW' and start_time and end_time:
-                            # Format time for better readability
-                            start_formatted = format_ups_time(start_time)
-                            end_formatted = format_ups_time(end_time)
-                            delivery_estimate = f"{start_formatted} - {end_formatted}"
-                        elif date_type == 'CMT' and end_time:
-                            end_formatted = format_ups_time(end_time)
-                            delivery_estimate = f"By {end_formatted}"
-            
-            # 3. If still not found, check package status for delivery information
-            if not delivery_estimate and 'SCHEDULED DELIVERY' in status.upper():
-                # Extract date from status if possible
-                import re
-                date_match = re.search(r'(\d{1,2}/\d{1,2}/\d{2,4})', status)
-                if date_match:
-                    delivery_date = date_match.group(1)
-                    # Try to convert MM/DD/YY format to more readable
-                    try:
-                        parts = delivery_date.split('/')
-                        if len(parts) == 3:
-                            month_num = int(parts[0])
-                            day = int(parts[1])
-                            year = parts[2]
-                            if len(year) == 2:
-                                year = "20" + year  # Assume 21st century
-                            
-                            month_names = ["January", "February", "March", "April", "May", "June", 
-                                            "July", "August", "September", "October", "November", "December"]
-                            month_name = month_names[month_num - 1] if 1 <= month_num <= 12 else ""
-                            
-                            if month_name:
-                                delivery_estimate = f"{month_name} {day}, {year}"
-                            else:
-                                delivery_estimate = delivery_date
-                        else:
-                            delivery_estimate = delivery_date
-                    except:
-                        delivery_estimate = delivery_date
-            
-            # If we found a delivery estimate, log it
-            if delivery_estimate:
-                logger.info(f"Extracted delivery estimate: {delivery_estimate}")
-            else:
-                logger.warning("No delivery estimate found in tracking data")
-            
-            return status, last_update, location, address_dict, delivery_estimate
-        except Exception as e:
-            logger.error(f"Error parsing tracking response: {e}")
-            import traceback
-            logger.error(f"Parse error details: {traceback.format_exc()}")
-            return None, None, None, None, None
-    
-    def validate_address(self, address):
-        """Validate address using USPS Address Validation API."""
-        # PLACEHOLDER - will implement once API credentials are available
-        logger.warning("USPS Address Validation not yet implemented")
-        return None
-    
-    def get_estimated_delivery(self, origin, destination):
-        """Get estimated delivery time using USPS APIs."""
-        # PLACEHOLDER - will implement once API credentials are available
-        logger.warning("USPS Estimated Delivery not yet implemented")
-        return None
-    
-    def parse_ups_tracking_response(self, tracking_data):
+    def parse_tracking_response(self, tracking_data):
         """Parse the UPS Tracking API response."""
         try:
             if not tracking_data:
                 return None, None, None, None, None
                 
             # Log the tracking data structure for debugging
-            logger.info(f"Parsing UPS tracking data response")
-            
-            # Extract package information
-            shipment = tracking_data.get('trackResponse', {}).get('shipment', [{}])[0]
-            package = shipment.get('package', [{}])[0]
+            logger.info("Parsing UPS tracking data response")
+            
+            # Extract package information, falling back to an empty record if missing
+            try:
+                shipment = tracking_data['trackResponse']['shipment'][0]
+            except (KeyError, IndexError, TypeError):
+                shipment = _EMPTY_DICT
+            try:
+                package = shipment['package'][0]
+            except (KeyError, IndexError, TypeError):
+                package = _EMPTY_DICT
             
             # Get status
-            activity = package.get('activity', [{}])[0]
-            status = activity.get('status', {}).get('description', 'Unknown')
-            
-            # Get last update time
-            date = activity.get('date', '')
-            time_str = activity.get('time', '')
-            
-            # Format the date and time for readability
-            formatted_date = self.format_api_date(date)
-            formatted_time = self.format_api_time(time_str)
-            
-            if formatted_date and formatted_time:
-                last_update = f"{formatted_date} at {formatted_time}"
-            elif formatted_date:
-                last_update = formatted_date
+            try:
+                activity = package['activity'][0]
+            except (KeyError, IndexError, TypeError):
+                activity = _EMPTY_DICT
+            if activity:
+                status = activity.get('status', _EMPTY_DICT).get('description', 'Unknown')
+                
+                # Get last update time
+                date = activity.get('date', '')
+                time_str = activity.get('time', '')
+                
+                # Format the date and time for readability
+                formatted_date = self.format_api_date(date) if date else ''
+                formatted_time = self.format_api_time(time_str) if time_str else ''
+                
+                if formatted_date and formatted_time:
+                    last_update = f"{formatted_date} at {formatted_time}"
+                elif formatted_date:
+                    last_update = formatted_date
+                else:
+                    last_update = 'Unknown'
+                
+                # Get location
+                location_info = activity.get('location', _EMPTY_DICT)
+                address = location_info.get('address', _EMPTY_DICT)
+                
+                city = address.get('city', '')
+                state = address.get('stateProvince', '')
+                country = address.get('country', '')
+                postal_code = address.get('postalCode', '')
+                
+                location_parts = [part for part in [city, state, country] if part]
+                location = ', '.join(location_parts) if location_parts else 'Unknown'
             else:
-                last_update = 'Unknown'
-            
-            # Get location
-            location_info = activity.get('location', {})
-            address = location_info.get('address', {})
-            
-            city = address.get('city', '')
-            state = address.get('stateProvince', '')
-            country = address.get('country', '')
-            postal_code = address.get('postalCode', '')
-            
-            location_parts = [part for part in [city, state, country] if part]
-            location = ', '.join(location_parts) if location_parts else 'Unknown'
+                # No scan events yet - skip the date, time and location formatting entirely
+                status = last_update = location = 'Unknown'
+                city = state = country = postal_code = ''
             
             # Extract street address if available
             street = ""
-            ship_to = shipment.get('shipTo', {})
+            ship_to = shipment.get('shipTo', _EMPTY_DICT)
             if ship_to:
-                ship_to_address = ship_to.get('address', {})
+                ship_to_address = ship_to.get('address', _EMPTY_DICT)
                 if ship_to_address:
-                    street_lines = ship_to_address.get('addressLine', [])
+                    street_lines = ship_to_address.get('addressLine', ())
                     if isinstance(street_lines, list) and street_lines:
                         street = street_lines[0]
                     elif isinstance(street_lines, str):
@@ -664,14 +923,14 @@ class UPSApi(CarrierAPI):
             # Check multiple places for delivery date information
             
             # 1. Check the deliveryDate object if present
-            delivery_dates = package.get('deliveryDate', [])
+            delivery_dates = package.get('deliveryDate', ())
             if delivery_dates:
                 for delivery_date_obj in delivery_dates:
                     date = delivery_date_obj.get('date', '')
                     type_code = delivery_date_obj.get('type', '')
                     
                     # Log what we found
-                    logger.info(f"Found UPS delivery date: {date}, type: {type_code}")
+                    logger.info("Found UPS delivery date: %s, type: %s", date, type_code)
                     
                     if date:
                         # Format date to be human-readable
@@ -681,13 +940,13 @@ class UPSApi(CarrierAPI):
             
             # 2. If not found, check deliveryTime object
             if not delivery_estimate:
-                delivery_time = package.get('deliveryTime', {})
+                delivery_time = package.get('deliveryTime', _EMPTY_DICT)
                 if delivery_time:
                     date_type = delivery_time.get('type', '')
                     start_time = delivery_time.get('startTime', '')
                     end_time = delivery_time.get('endTime', '')
                     
-                    logger.info(f"Found UPS delivery time: type={date_type}, start={start_time}, end={end_time}")
+                    logger.info("Found UPS delivery time: type=%s, start=%s, end=%s", date_type, start_time, end_time)
                     
                     if date_type and (start_time or end_time):
                         if date_type == 'EDW' and start_time and end_time:
@@ -700,97 +959,31 @@ class UPSApi(CarrierAPI):
                             delivery_estimate = f"By {end_formatted}"
             
             # 3. If still not found, check package status for delivery information
-            if not delivery_estimate and 'SCHEDULED DELIVERY' in status.upper():
+            if not delivery_estimate and _SCHED_RE.search(status):
                 # Extract date from status if possible
-                date_match = re.search(r'(\d{1,2}/\d{1,2}/\d{2,4})', status)
+                date_match = _UPS_DATE_RE.search(status)
                 if date_match:
-                    delivery_date = date_match.group(1)
-                    # Try to convert MM/DD/YY format to more readable
-                    try:
-                        parts = delivery_date.split('/')
-                        if len(parts) == 3:
-                            month_num = int(parts[0])
-                            day = int(parts[1])
-                            year = parts[2]
-                            if len(year) == 2:
-                                year = "20" + year  # Assume 21st century
-                            
-                            month_names = ["January", "February", "March", "April", "May", "June", 
-                                          "July", "August", "September", "October", "November", "December"]
-                            month_name = month_names[month_num - 1] if 1 <= month_num <= 12 else ""
-                            
-                            if month_name:
-                                delivery_estimate = f"{month_name} {day}, {year}"
-                            else:
-                                delivery_estimate = delivery_date
-                        else:
-                            delivery_estimate = delivery_date
-                    except:
-                        delivery_estimate = delivery_date
+                    # Convert MM/DD/YY to the same readable form as other UPS dates
+                    delivery_estimate = self.format_api_date(date_match.group(1))
             
             # If we found a delivery estimate, log it
             if delivery_estimate:
-                logger.info(f"Extracted UPS delivery estimate: {delivery_estimate}")
+                logger.info("Extracted UPS delivery estimate: %s", delivery_estimate)
             else:
                 logger.warning("No delivery estimate found in UPS tracking data")
             
             return status, last_update, location, address_dict, delivery_estimate
         except Exception as e:
-            logger.error(f"Error parsing UPS tracking response: {e}")
+            logger.error("Error parsing UPS tracking response: %s", e)
             return None, None, None, None, None
     
     def format_api_date(self, date_str):
         """Format UPS date strings to be more human-readable."""
-        try:
-            if not date_str or len(date_str) < 8:
-                return date_str
-                
-            # Check if it's in the format YYYYMMDD
-            if len(date_str) >= 8 and date_str.isdigit():
-                year = date_str[:4]
-                month = date_str[4:6]
-                day = date_str[6:8]
-                
-                # Convert month number to name
-                month_names = ["January", "February", "March", "April", "May", "June", 
-                               "July", "August", "September", "October", "November", "December"]
-                try:
-                    month_num = int(month)
-                    if 1 <= month_num <= 12:
-                        month_name = month_names[month_num - 1]
-                        return f"{month_name} {int(day)}, {year}"
-                except:
-                    pass
-                    
-            # For other formats, return as is
-            return date_str
-        except Exception as e:
-            logger.error(f"Error formatting UPS date {date_str}: {e}")
-            return date_str
+        return format_ups_date(date_str)
     
     def format_api_time(self, time_str):
         """Format UPS time strings to be more human-readable."""
-        try:
-            if not time_str or len(time_str) < 6:
-                return time_str
-                
-            # Check if it's in the format HHMMSS
-            if len(time_str) >= 6 and time_str.isdigit():
-                hour = int(time_str[:2])
-                minute = time_str[2:4]
-                
-                # Convert to 12-hour format with AM/PM
-                am_pm = "AM" if hour < 12 else "PM"
-                hour_12 = hour if hour <= 12 else hour - 12
-                hour_12 = 12 if hour_12 == 0 else hour_12  # Convert 0 to 12 for 12 AM
-                
-                return f"{hour_12}:{minute} {am_pm}"
-                    
-            # For other formats, return as is
-            return time_str
-        except Exception as e:
-            logger.error(f"Error formatting UPS time {time_str}: {e}")
-            return time_str
+        return format_ups_time(time_str)
 
 
 class USPSApi(CarrierAPI):
@@ -805,7 +998,7 @@ class USPSApi(CarrierAPI):
         if not self.user_id:
             logger.warning("USPS_USER_ID not set, USPS tracking will be unavailable")
         else:
-            logger.info(f"USPS API configured with User ID: {self.user_id[:4]}****")
+            logger.info("USPS API configured with User ID: %s****", self.user_id[:4])
     
     def get_tracking_info(self, tracking_number):
         """Get tracking information from USPS API."""
@@ -899,14 +1092,11 @@ class USPSApi(CarrierAPI):
                 return self.standardize_response(None, status="API Error", carrier_name="USPS")
             """
         except Exception as e:
-            logger.error(f"Error getting USPS tracking info for {tracking_number}: {e}")
+            logger.error("Error getting USPS tracking info for %s: %s", tracking_number, e)
             return self.standardize_response(None, status="Error", carrier_name="USPS")
             
     def _get_usps_mock_data(self, tracking_number):
         """Create mock USPS tracking data for development."""
-        import random
-        from datetime import datetime, timedelta
-        
         # Current date/time
         now = datetime.now()
         
@@ -914,16 +1104,6 @@ class USPSApi(CarrierAPI):
         delivery_days = random.randint(1, 5)
         delivery_date = now + timedelta(days=delivery_days)
         
-        # Possible statuses
-        statuses = [
-            "Accepted at USPS Origin Facility",
-            "Departed USPS Regional Facility",
-            "Arrived at USPS Regional Facility",
-            "In Transit to Next Facility", 
-            "Out for Delivery",
-            "Delivered, In/At Mailbox"
-        ]
-        
         # Get a status based on delivery days
         if delivery_days <= 0:
             status = "Delivered, In/At Mailbox"
@@ -931,20 +1111,17 @@ class USPSApi(CarrierAPI):
             status = "Out for Delivery"
         else:
             status_index = min(5 - delivery_days, 3)
-            status = statuses[status_index]
+            status = _USPS_MOCK_STATUSES[status_index]
         
         # Format dates
         last_update = now.strftime("%B %d, %Y at %I:%M %p")
         expected_delivery = delivery_date.strftime("%B %d, %Y")
         
-        # Mock locations
-        cities = ["New York", "Chicago", "Los Angeles", "Houston", "Miami", "Denver", "Seattle"]
-        states = ["NY", "IL", "CA", "TX", "FL", "CO", "WA"]
-        
         # Choose a random location
-        location_index = random.randint(0, len(cities) - 1)
-        city = cities[location_index]
-        state = states[location_index]
+        city, state = random.choice(_USPS_MOCK_LOCATIONS)
+        
+        # Build the event summary once; it doubles as the only event
+        summary = f"{status} at {last_update} in {city}, {state}"
         
         # Create mock data structure
         mock_data = {
@@ -953,9 +1130,9 @@ class USPSApi(CarrierAPI):
             'status_category': 'In Transit' if delivery_days > 0 else 'Delivered',
             'status_summary': status,
             'expected_delivery_date': expected_delivery,
-            'summary': f"{status} at {last_update} in {city}, {state}",
+            'summary': summary,
             'events': [
-                f"{status} at {last_update} in {city}, {state}"
+                summary
             ],
             'city': city,
             'state': state,
@@ -963,7 +1140,22 @@ class USPSApi(CarrierAPI):
             'last_update': last_update
         }
         
- 
+        logger.info("Generated mock USPS data for %s: %s", tracking_number, status)
+        return mock_data
+    
+    def validate_address(self, address):
+        """Validate address using USPS Address Validation API."""
+        # PLACEHOLDER - will implement once API credentials are available
+        logger.warning("USPS Address Validation not yet implemented")
+        return None
+    
+    def get_estimated_delivery(self, origin, destination):
+        """Get estimated delivery time using USPS APIs."""
+        # PLACEHOLDER - will implement once API credentials are available
+        logger.warning("USPS Estimated Delivery not yet implemented")
+        return None
+
+
 class DHLApi(CarrierAPI):
     """DHL API implementation."""
     
@@ -977,7 +1169,7 @@ class DHLApi(CarrierAPI):
             logger.warning("DHL_API_KEY not set, DHL tracking will be unavailable")
         else:
             masked_key = self.api_key[:4] + '*' * (len(self.api_key) - 8) + self.api_key[-4:] if len(self.api_key) > 8 else '****'
-            logger.info(f"DHL API configured with API Key: {masked_key}")
+            logger.info("DHL API configured with API Key: %s", masked_key)
     
     def get_tracking_info(self, tracking_number):
         """Get tracking information from DHL API."""
@@ -1038,14 +1230,11 @@ class DHLApi(CarrierAPI):
                 return self.standardize_response(None, status="API Error", carrier_name="DHL")
             """
         except Exception as e:
-            logger.error(f"Error getting DHL tracking info for {tracking_number}: {e}")
+            logger.error("Error getting DHL tracking info for %s: %s", tracking_number, e)
             return self.standardize_response(None, status="Error", carrier_name="DHL")
     
     def _get_dhl_mock_data(self, tracking_number):
         """Create mock DHL tracking data for development."""
-        import random
-        from datetime import datetime, timedelta
-        
         # Current date/time
         now = datetime.now()
         
@@ -1053,17 +1242,6 @@ class DHLApi(CarrierAPI):
         delivery_days = random.randint(1, 5)
         delivery_date = now + timedelta(days=delivery_days)
         
-        # Possible statuses based on DHL tracking status
-        statuses = [
-            "Shipment picked up",
-            "Processed at DHL Location",
-            "Departed Facility",
-            "In Transit", 
-            "Arrived at Delivery Facility",
-            "With Delivery Courier",
-            "Delivered"
-        ]
-        
         # Get a status based on delivery days
         if delivery_days <= 0:
             status = "Delivered"
@@ -1071,22 +1249,16 @@ class DHLApi(CarrierAPI):
             status = "With Delivery Courier"
         else:
             status_index = min(6 - delivery_days, 5)
-            status = statuses[status_index]
+            status = _DHL_MOCK_STATUSES[status_index]
         
         # Format dates
         last_update = now.strftime("%Y-%m-%dT%H:%M:%S")
         expected_delivery = delivery_date.strftime("%Y-%m-%dT%H:%M:%S")
         
-        # Mock locations
-        cities = ["Berlin", "Frankfurt", "London", "Paris", "Madrid", "Rome", "Amsterdam"]
-        countries = ["Germany", "Germany", "United Kingdom", "France", "Spain", "Italy", "Netherlands"]
-        country_codes = ["DE", "DE", "GB", "FR", "ES", "IT", "NL"]
-        
         # Choose a random location
-        location_index = random.randint(0, len(cities) - 1)
-        city = cities[location_index]
-        country = countries[location_index]
-        country_code = country_codes[location_index]
+        city, country, country_code = random.choice(_DHL_MOCK_LOCATIONS)
+        
+        status_code = 'delivered' if status == 'Delivered' else 'transit'
         
         # Create mock data structure similar to DHL API response
         mock_data = {
@@ -1109,7 +1281,7 @@ class DHLApi(CarrierAPI):
                 },
                 'status': {
                     'timestamp': last_update,
-                    'statusCode': 'delivered' if status == 'Delivered' else 'transit',
+                    'statusCode': status_code,
                     'status': status,
                     'description': status
                 },
@@ -1120,7 +1292,7 @@ class DHLApi(CarrierAPI):
                 'events': [
                     {
                         'timestamp': last_update,
-                        'statusCode': 'delivered' if status == 'Delivered' else 'transit',
+                        'statusCode': status_code,
                         'status': status,
                         'description': status,
                         'location': {
@@ -1133,20 +1305,21 @@ class DHLApi(CarrierAPI):
             }]
         }
         
-        logger.info(f"Generated mock DHL data for {tracking_number}: {status}")
+        logger.info("Generated mock DHL data for %s: %s", tracking_number, status)
         return mock_data
     
     def parse_tracking_response(self, tracking_data):
         """Parse the DHL tracking response."""
         try:
-            if not tracking_data or 'shipments' not in tracking_data or not tracking_data['shipments']:
+            shipments = tracking_data.get('shipments') if tracking_data else None
+            if not shipments:
                 return None, None, None, None, None
             
             # Extract shipment info
-            shipment = tracking_data['shipments'][0]
+            shipment = shipments[0]
             
             # Extract status
-            status_info = shipment.get('status', {})
+            status_info = shipment.get('status', _EMPTY_DICT)
             status = status_info.get('description', 'Unknown')
             
             # Extract timestamp
@@ -1154,7 +1327,7 @@ class DHLApi(CarrierAPI):
             last_update = self.format_api_date(timestamp)
             
             # Extract location from most recent event
-            events = shipment.get('events', [])
+            events = shipment.get('events', ())
             location = 'Unknown'
             city = ''
             country = ''
@@ -1162,13 +1335,15 @@ class DHLApi(CarrierAPI):
             
             if events:
                 latest_event = events[0]  # Most recent event
-                location_info = latest_event.get('location', {})
+                location_info = latest_event.get('location', _EMPTY_DICT)
                 city = location_info.get('city', '')
                 country = location_info.get('country', '')
                 country_code = location_info.get('countryCode', '')
                 
-                location_parts = [part for part in [city, country] if part]
-                location = ', '.join(location_parts) if location_parts else 'Unknown'
+                if city and country:
+                    location = f"{city}, {country}"
+                else:
+                    location = city or country or 'Unknown'
             
             # Create address dict for validation
             address_dict = {
@@ -1179,7 +1354,7 @@ class DHLApi(CarrierAPI):
             
             # Extract delivery estimate
             delivery_estimate = None
-            est_timeframe = shipment.get('estimatedDeliveryTimeframe', {})
+            est_timeframe = shipment.get('estimatedDeliveryTimeframe', _EMPTY_DICT)
             
             if est_timeframe:
                 est_date = est_timeframe.get('estimatedThrough', '')
@@ -1188,26 +1363,12 @@ class DHLApi(CarrierAPI):
             
             return status, last_update, location, address_dict, delivery_estimate
         except Exception as e:
-            logger.error(f"Error parsing DHL tracking response: {e}")
+            logger.error("Error parsing DHL tracking response: %s", e)
             return None, None, None, None, None
     
     def format_api_date(self, date_str):
         """Format DHL date strings (ISO 8601) to be more human-readable."""
-        try:
-            if not date_str:
-                return 'Unknown'
-                
-            # DHL uses ISO 8601 format (YYYY-MM-DDTHH:MM:SS)
-            from datetime import datetime
-            
-            # Parse ISO format
-            dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-            
-            # Format as human readable
-            return dt.strftime("%B %d, %Y at %I:%M %p")
-        except Exception as e:
-            logger.error(f"Error formatting DHL date {date_str}: {e}")
-            return date_str
+        return format_dhl_date(date_str)
     
     def validate_address(self, address):
         """Validate address using DHL address validation."""
@@ -1223,6 +1384,10 @@ class DHLApi(CarrierAPI):
 
 
 # Factory to create the appropriate carrier API instance
+# One shared API instance per carrier, so credentials and sessions are set up once per process
+_CARRIER_INSTANCE_CACHE = {}
+_CARRIER_INSTANCE_LOCK = threading.Lock()
+
 def create_carrier_api(carrier_name=None, tracking_number=None):
     """
     Factory function to create the appropriate carrier API instance.
@@ -1232,7 +1397,7 @@ def create_carrier_api(carrier_name=None, tracking_number=None):
         tracking_number (str, optional): If carrier_name not provided, will try to detect from tracking number
         
     Returns:
-        CarrierAPI: An instance of the appropriate carrier API class
+        CarrierAPI: The shared instance of the appropriate carrier API class
     """
     # Import here to avoid circular import
     from carrier_detector import detect_carrier
@@ -1243,19 +1408,27 @@ def create_carrier_api(carrier_name=None, tracking_number=None):
     
     # Default to UPS if still unknown
     if not carrier_name or carrier_name == 'UNKNOWN':
-        logger.warning(f"Unknown carrier for tracking number: {tracking_number}, defaulting to UPS")
+        logger.warning("Unknown carrier for tracking number: %s, defaulting to UPS", tracking_number)
         carrier_name = 'UPS'
     
-    # Create the appropriate API instance
-    carrier_apis = {
-        'UPS': UPSApi,
-        'USPS': USPSApi,
-        'DHL': DHLApi
-    }
-    
-    api_class = carrier_apis.get(carrier_name)
-    if not api_class:
-        logger.error(f"No API implementation found for carrier: {carrier_name}")
-        return None
+    # Reuse the process-wide instance for this carrier, creating it on first use
+    api = _CARRIER_INSTANCE_CACHE.get(carrier_name)
+    if api is not None:
+        return api
     
-    return api_class()
\ No newline at end of file
+    with _CARRIER_INSTANCE_LOCK:
+        api = _CARRIER_INSTANCE_CACHE.get(carrier_name)
+        if api is None:
+            # Create the appropriate API instance
+            match carrier_name:
+                case 'UPS':
+                    api = UPSApi()
+                case 'USPS':
+                    api = USPSApi()
+                case 'DHL':
+                    api = DHLApi()
+                case _:
+                    logger.error("No API implementation found for carrier: %s", carrier_name)
+                    return None
+            _CARRIER_INSTANCE_CACHE[carrier_name] = api
+    return api
\ No newline at end of file
@@ -35,6 +35,102 @@ CARRIER_PATTERNS = {
     ]
 }
 
+def _fuse_patterns(carrier_patterns):
+    """
+    Combine every carrier pattern into one anchored alternation with a named group each.
+    
+    Args:
+        carrier_patterns (dict): Carrier name mapped to a list of anchored pattern strings
+        
+    Returns:
+        tuple: Compiled regex and a dict mapping group names back to carriers
+    """
+    alternatives = []
+    group_carriers = {}
+    for carrier, patterns in carrier_patterns.items():
+        for i, pattern in enumerate(patterns):
+            name = f"{carrier}_{i}"
+            # Inner groups become non-capturing so lastgroup always names the outer group
+            body = re.sub(r'\((?!\?)', '(?:', pattern.removeprefix('^').removesuffix('$'))
+            alternatives.append(f"(?P<{name}>{body})")
+            group_carriers[name] = carrier
+    return re.compile('^(?:' + '|'.join(alternatives) + ')$', re.ASCII), group_carriers
+
+# All patterns fused into a single ASCII-only regex; alternation order preserves carrier priority
+_FUSED_RE, _GROUP_CARRIERS = _fuse_patterns(CARRIER_PATTERNS)
+
+# Carrier for each length of a purely numeric tracking number (see CARRIER_PATTERNS)
+_DIGIT_LENGTH_CARRIERS = {
+    9: 'UPS',
+    10: 'DHL',
+    11: 'DHL',
+    12: 'UPS',
+    13: 'USPS',
+    20: 'USPS'
+}
+
+def _detect_numeric_carrier(tracking_number):
+    """
+    Detect the carrier of an all-ASCII-digit tracking number by length alone.
+    
+    Args:
+        tracking_number (str): Cleaned tracking number consisting only of 0-9
+        
+    Returns:
+        str: Carrier name or 'UNKNOWN'
+    """
+    length = len(tracking_number)
+    # USPS Intelligent Mail: 16-22 digits starting with 9
+    if tracking_number[0] == '9' and 16 <= length <= 22:
+        return 'USPS'
+    return _DIGIT_LENGTH_CARRIERS.get(length, 'UNKNOWN')
+
+# Single candidate pattern for each distinctive leading prefix
+_PREFIX_DISPATCH = {
+    '1Z': ('UPS', re.compile(CARRIER_PATTERNS['UPS'][0], re.ASCII)),   # 1Z + 16 chars
+    'JD': ('DHL', re.compile(CARRIER_PATTERNS['DHL'][1], re.ASCII)),   # JD + 18 digits
+    'T': ('UPS', re.compile(CARRIER_PATTERNS['UPS'][1], re.ASCII)),    # Mail Innovations
+    'H': ('UPS', re.compile(CARRIER_PATTERNS['UPS'][4], re.ASCII)),
+    'V': ('UPS', re.compile(CARRIER_PATTERNS['UPS'][4], re.ASCII)),
+    'R': ('UPS', re.compile(CARRIER_PATTERNS['UPS'][4], re.ASCII)),
+    'U': ('UPS', re.compile(CARRIER_PATTERNS['UPS'][4], re.ASCII))
+}
+
+# USPS International numbers end in US
+_USPS_INTERNATIONAL_RE = re.compile(CARRIER_PATTERNS['USPS'][1], re.ASCII)
+
+def _detect_prefixed_carrier(tracking_number):
+    """
+    Detect the carrier of a tracking number from its prefix or suffix with a single regex check.
+    
+    Args:
+        tracking_number (str): Cleaned, non-numeric tracking number
+        
+    Returns:
+        str: Carrier name, or None if the full pattern set has to be consulted
+    """
+    candidate = _PREFIX_DISPATCH.get(tracking_number[:2]) or _PREFIX_DISPATCH.get(tracking_number[:1])
+    if candidate and candidate[1].match(tracking_number):
+        return candidate[0]
+    if tracking_number.endswith('US') and _USPS_INTERNATIONAL_RE.match(tracking_number):
+        return 'USPS'
+    return None
+
+def _clean_tracking_number(tracking_number):
+    """
+    Strip whitespace, remove inner spaces and uppercase a tracking number.
+    Already-clean values (ASCII letters and digits, no lowercase) are returned unchanged.
+    
+    Args:
+        tracking_number (str): Raw tracking number
+        
+    Returns:
+        str: Cleaned tracking number
+    """
+    if tracking_number.isascii() and tracking_number.isalnum() and (tracking_number.isdigit() or tracking_number.isupper()):
+        return tracking_number
+    return tracking_number.strip().upper().replace(' ', '')
+
 def detect_carrier(tracking_number):
     """
     Detect which carrier a tracking number belongs to.
@@ -49,18 +145,30 @@ def detect_carrier(tracking_number):
         return 'UNKNOWN'
     
     # Clean the tracking number - remove spaces and convert to uppercase
-    tracking_number = tracking_number.strip().upper().replace(' ', '')
+    tracking_number = _clean_tracking_number(tracking_number)
+    
+    logger.debug("Detecting carrier for tracking number: %s", tracking_number)
+    
+    # Tracking numbers are plain ASCII, so anything else can be rejected without a regex
+    if not tracking_number.isascii():
+        logger.warning("Could not detect carrier for non-ASCII tracking number: %s", tracking_number)
+        return 'UNKNOWN'
     
-    logger.debug(f"Detecting carrier for tracking number: {tracking_number}")
+    # Purely numeric numbers are identified by length, known prefixes by one targeted regex,
+    # and anything else falls back to the fused pattern
+    if tracking_number.isdigit():
+        carrier = _detect_numeric_carrier(tracking_number)
+    else:
+        carrier = _detect_prefixed_carrier(tracking_number)
+        if carrier is None:
+            match = _FUSED_RE.match(tracking_number)
+            carrier = _GROUP_CARRIERS[match.lastgroup] if match else 'UNKNOWN'
     
-    # Check against each carrier's patterns
-    for carrier, patterns in CARRIER_PATTERNS.items():
-        for pattern in patterns:
-            if re.match(pattern, tracking_number):
-                logger.info(f"Detected carrier for {tracking_number}: {carrier}")
-                return carrier
+    if carrier != 'UNKNOWN':
+        logger.info("Detected carrier for %s: %s", tracking_number, carrier)
+        return carrier
     
-    logger.warning(f"Could not detect carrier for tracking number: {tracking_number}")
+    logger.warning("Could not detect carrier for tracking number: %s", tracking_number)
     return 'UNKNOWN'
 
 def format_tracking_number(tracking_number, carrier=None):
@@ -79,7 +187,7 @@ def format_tracking_number(tracking_number, carrier=None):
         return tracking_number
     
     # Strip spaces and convert to uppercase
-    tracking_number = tracking_number.strip().upper().replace(' ', '')
+    tracking_number = _clean_tracking_number(tracking_number)
     
     # Detect carrier if not provided
     if not carrier:
@@ -87,8 +195,8 @@ def format_tracking_number(tracking_number, carrier=None):
     
     # Apply carrier-specific formatting
     if carrier == 'DHL' and len(tracking_number) == 10:
-        # Format DHL as #### #### ##
-        if re.match(r'^[0-9]{10}$', tracking_number):
+        # Format DHL as #### #### ## (ASCII digits only, matching [0-9])
+        if tracking_number.isascii() and tracking_number.isdigit():
             return f"{tracking_number[:4]} {tracking_number[4:8]} {tracking_number[8:]}"
     
     # Return as is for other carriers
@@ -108,7 +216,7 @@ def validate_tracking_number(tracking_number):
         return False
     
     # Clean the tracking number
-    tracking_number = tracking_number.strip().upper().replace(' ', '')
+    tracking_number = _clean_tracking_number(tracking_number)
     
     # Check if it matches any carrier pattern
     carrier = detect_carrier(tracking_number)
@@ -9,27 +9,17 @@ they are valid tracking numbers. No other columns are touched.
 
 import os
 import base64
-import json
+import itertools
 import logging
 import re
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from types import MappingProxyType
  
+import orjson
 import requests
-
-def fetch_labels_for_shipment(shipment_id, api_key):
-    """
-    Fetch Label objects for a given shipment to extract tracking numbers.
-    """
-    url = "https://api.shipstation.com/v2/labels"
-    params = {'shipment_id': shipment_id, 'page': 1, 'page_size': 100}
-    headers = {'API-Key': api_key, 'Content-Type': 'application/json'}
-    response = requests.get(url, headers=headers, params=params)
-    if response.status_code != 200:
-        logger.error(f"Failed to fetch labels for shipment {shipment_id}: {response.status_code} - {response.text}")
-        return []
-    data = response.json()
-    return data.get('labels', [])
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import gspread
 from google.oauth2.service_account import Credentials
@@ -53,17 +43,53 @@ SCOPES = [
 
 # Constants
 SHEET_NAME = 'UPS Tracker'
+PAGE_FETCH_WORKERS = 4  # Concurrent shipments page requests after the first page
+LABEL_FETCH_WORKERS = 8  # Concurrent label lookups; together with pages kept below the session pool size
+
+# Shared ShipStation session: keep-alive and pooled connections instead of a new
+# TCP+TLS handshake for every shipments page and label lookup. Rate limits (429) and
+# transient server errors are retried with backoff, honouring Retry-After; once retries
+# run out the last response is returned so callers log it as before
+SHIPSTATION_SESSION = requests.Session()
+SHIPSTATION_RETRIES = Retry(
+    total=5,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(['GET']),
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
+SHIPSTATION_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=SHIPSTATION_RETRIES))
+SHIPSTATION_SESSION.headers.update({'Content-Type': 'application/json'})
+SHIPSTATION_TIMEOUT = 30  # seconds; sessions have no default, so a stalled request would hang a worker
 
-# Valid tracking number patterns
-TRACKING_PATTERNS = {
+# Valid tracking number patterns, compiled once at import
+TRACKING_PATTERNS = {carrier: re.compile(pattern) for carrier, pattern in {
     'UPS': r'^1Z[0-9A-Z]{16}$|^T\d{10}$|^\d{9}$',
     'USPS': r'^9[0-9]{15,21}$|^[A-Z]{2}[0-9]{9}US$',
     'FedEx': r'^[0-9]{12,14}$|^[0-9]{20,22}$',
     'DHL': r'^[0-9]{10,11}$'
-}
+}.items()}
+
+# Carriers whose tracking numbers are seeded, in match priority order
+TARGET_PATTERNS = tuple((carrier, TRACKING_PATTERNS[carrier]) for carrier in ('UPS', 'USPS', 'DHL'))
+
+# The target patterns fused into one alternation; the named group that matched is the carrier
+TARGET_CARRIER_RE = re.compile('|'.join(f'(?P<{carrier}>{pattern.pattern})' for carrier, pattern in TARGET_PATTERNS))
+
+# Authorized worksheet, reused for the rest of the process once opened
+_SHEET = None
 
 def setup_google_sheets():
-    """Authenticate with Google Sheets API using service account credentials."""
+    """
+    Authenticate with Google Sheets API using service account credentials.
+    The worksheet is opened once and reused on later calls; gspread refreshes
+    the access token itself when it expires.
+    """
+    global _SHEET
+    if _SHEET is not None:
+        return _SHEET
+    
     try:
         # Check if credentials are provided as a file or as a base64-encoded string
         if os.path.exists('credentials.json'):
@@ -72,18 +98,19 @@ def setup_google_sheets():
         else:
             # Decode base64-encoded credentials from environment variable
             logger.info("Using GOOGLE_CREDENTIALS environment variable")
-            credentials_json = base64.b64decode(os.environ['GOOGLE_CREDENTIALS']).decode('utf-8')
-            credentials_info = json.loads(credentials_json)
+            credentials_json = base64.b64decode(os.environ['GOOGLE_CREDENTIALS'])
+            credentials_info = orjson.loads(credentials_json)
             creds = Credentials.from_service_account_info(credentials_info, scopes=SCOPES)
         
         # Connect to Google Sheets
         client = gspread.authorize(creds)
         sheet = client.open(SHEET_NAME).sheet1
         
-        logger.info(f"Successfully connected to Google Sheet: {SHEET_NAME}")
+        logger.info("Successfully connected to Google Sheet: %s", SHEET_NAME)
+        _SHEET = sheet
         return sheet
     except Exception as e:
-        logger.error(f"Error setting up Google Sheets: {e}")
+        logger.error("Error setting up Google Sheets: %s", e)
         raise
 
 def is_valid_tracking_number(tracking_number):
@@ -95,11 +122,78 @@ def is_valid_tracking_number(tracking_number):
         return False
         
     for pattern in TRACKING_PATTERNS.values():
-        if re.match(pattern, tracking_number):
+        if pattern.match(tracking_number):
             return True
     
     return False
 
+def match_target_carrier(tracking_number):
+    """
+    Return the target carrier (UPS, USPS or DHL) whose pattern fully matches the tracking number.
+    Returns None for other carriers and invalid tracking numbers.
+    """
+    match = TARGET_CARRIER_RE.fullmatch(tracking_number)
+    return match.lastgroup if match else None
+
+def process_shipment(shipment, labels, checked_numbers):
+    """
+    Extract new valid tracking numbers from a shipment and its labels.
+    
+    Args:
+        shipment: ShipStation V2 shipment object
+        labels: Label objects fetched for the shipment (empty if none were requested)
+        checked_numbers: Tracking numbers already seen this run; updated in place
+        
+    Returns:
+        list: Valid target-carrier tracking numbers, shipment-level first, then label-level
+    """
+    found = []
+    # 1. The shipment-level tracking number, then 2. label-level tracking numbers
+    candidates = [(shipment.get('trackingNumber') or shipment.get('tracking_number'), "")]
+    candidates.extend((label.get('tracking_number') or label.get('trackingNumber'), " on label") for label in labels)
+    
+    for tracking, source in candidates:
+        if not tracking or tracking in checked_numbers:
+            continue
+        checked_numbers.add(tracking)
+        carrier = match_target_carrier(tracking)
+        if carrier:
+            found.append(tracking)
+            logger.info("Found valid %s tracking number%s: %s", carrier, source, tracking)
+        else:
+            logger.debug("Filtered out non-target or invalid tracking number%s: %s", source, tracking)
+    return found
+
+def fetch_labels_for_shipment(shipment_id, api_key):
+    """
+    Fetch Label objects for a given shipment to extract tracking numbers.
+    """
+    url = "https://api.shipstation.com/v2/labels"
+    params = {'shipment_id': shipment_id, 'page': 1, 'page_size': 100}
+    headers = {'API-Key': api_key}
+    response = SHIPSTATION_SESSION.get(url, headers=headers, params=params, timeout=SHIPSTATION_TIMEOUT)
+    if response.status_code != 200:
+        logger.error("Failed to fetch labels for shipment %s: %s - %s", shipment_id, response.status_code, response.text)
+        return []
+    data = orjson.loads(response.content)
+    return data.get('labels', [])
+
+def fetch_shipments_page(base_params, page, api_key):
+    """
+    Fetch one page of V2 shipments using the shared query in base_params.
+    Returns the decoded response body, or None if the request failed.
+    """
+    url = "https://api.shipstation.com/v2/shipments"
+    params = {**base_params, 'page': page}
+    # V2 API uses API-Key header for authentication
+    headers = {'API-Key': api_key}
+    logger.info("Fetching ShipStation shipments page %s", page)
+    response = SHIPSTATION_SESSION.get(url, params=params, headers=headers, timeout=SHIPSTATION_TIMEOUT)
+    if response.status_code != 200:
+        logger.error("Failed to fetch from ShipStation API: %s - %s", response.status_code, response.text)
+        return None
+    return orjson.loads(response.content)
+
 def get_existing_tracking_numbers(sheet):
     """
     Get all existing tracking numbers from the sheet.
@@ -116,7 +210,7 @@ def get_existing_tracking_numbers(sheet):
         # Convert to set for O(1) lookup
         return set(col_values)
     except Exception as e:
-        logger.error(f"Error getting existing tracking numbers: {e}")
+        logger.error("Error getting existing tracking numbers: %s", e)
         return set()
 
 def fetch_shipstation_tracking_numbers(days_to_look_back=180):
@@ -130,6 +224,8 @@ def fetch_shipstation_tracking_numbers(days_to_look_back=180):
         list: List of valid tracking numbers (strings)
     """
     valid_tracking_numbers = []
+    checked_numbers = set()  # To avoid duplicates across the whole run
+    seen_shipment_ids = set()  # Shipments whose labels have already been requested
     
     try:
         # Get ShipStation API key from environment
@@ -141,116 +237,90 @@ def fetch_shipstation_tracking_numbers(days_to_look_back=180):
         
         # Calculate date for filtering
         # Only include shipments from the last 120 days
-        cutoff_date = datetime.now() - timedelta(days=120)
+        # The window is computed once so every page queries the same range
+        now = datetime.now()
+        cutoff_date = now - timedelta(days=120)
         
-        # ShipStation API V2 endpoint for listing shipments
-        url = "https://api.shipstation.com/v2/shipments"
+        # ShipStation API uses pagination
+        page_size = 500  # Larger pages mean fewer round trips per run
+        max_pages = 20  # Sanity bound (10,000 shipments) on a runaway page count
         
-        # V2 API uses API-Key header for authentication
-        headers = {
-            'API-Key': api_key,
-            'Content-Type': 'application/json'
-        }
+        # Build parameters using V2 API snake_case naming; read-only since pages share it
+        base_params = MappingProxyType({
+            'created_at_start': cutoff_date.isoformat(),
+            'created_at_end': now.isoformat(),
+            'sort_by': 'created_at',
+            'sort_dir': 'desc',
+            'page_size': page_size
+        })
         
-        # ShipStation API uses pagination
-        page = 1
-        page_size = 100
-        more_pages = True
-        max_pages = 20  # Limit to processing only 20 pages
+        # Page 1 reports how many pages exist; the remaining pages are then fetched
+        # concurrently and processed in page order as they complete
+        first_page = fetch_shipments_page(base_params, 1, api_key)
+        total_pages = first_page.get('pages', 1) if first_page else 1
+        # A short first page means there is nothing further to request
+        if first_page and len(first_page.get('shipments', [])) < page_size:
+            total_pages = 1
+        last_page = min(total_pages, max_pages)
+        if last_page < total_pages:
+            logger.info("Reached max page limit (%s), fetching %s of %s pages", max_pages, last_page, total_pages)
         
-        while more_pages:
-            # Build parameters using V2 API snake_case naming
-            now_iso = datetime.now().isoformat()
-            cutoff_iso = cutoff_date.isoformat()
-            params = {
-                'created_at_start': cutoff_iso,
-                'created_at_end': now_iso,
-                'sort_by': 'created_at',
-                'sort_dir': 'desc',
-                'page': page,
-                'page_size': page_size
-            }
-            
-            logger.info(f"Fetching ShipStation shipments page {page}")
-            
-            # Make the request
-            response = requests.get(
-                url,
-                params=params,
-                headers=headers
+        # One label pool serves the whole run, so label lookups for a page start as soon as
+        # it arrives and overlap with fetching and reading the pages after it
+        pending_shipments = []  # (shipment, label future or None) in page order
+        with ThreadPoolExecutor(max_workers=PAGE_FETCH_WORKERS) as page_executor, \
+                ThreadPoolExecutor(max_workers=LABEL_FETCH_WORKERS) as label_executor:
+            remaining_pages = page_executor.map(
+                lambda page: fetch_shipments_page(base_params, page, api_key),
+                range(2, last_page + 1)
             )
-            
-            if response.status_code != 200:
-                logger.error(f"Failed to fetch from ShipStation API: {response.status_code} - {response.text}")
-                break
-            
-            # Process response
-            data = response.json()
-            shipments = data.get('shipments', [])
-            total_pages = data.get('pages', 1)
-            
-            logger.info(f"Fetched {len(shipments)} shipments from page {page} of {total_pages}")
-            # Stop early if we've reached the maximum page limit
-            if page >= max_pages:
-                logger.info(f"Reached max page limit ({max_pages}), stopping fetch early")
-                break
-
-            if not shipments:
-                logger.info("No more shipments to fetch")
-                break
-            
-            # Extract tracking numbers
-            for shipment in shipments:
-                checked_numbers = set()  # To avoid duplicates
-                tracking = shipment.get('trackingNumber') or shipment.get('tracking_number')
-                if tracking and tracking not in checked_numbers:
-                    for carrier in ('UPS', 'USPS', 'DHL'):
-                        pattern = TRACKING_PATTERNS.get(carrier)
-                        if pattern and re.fullmatch(pattern, tracking):
-                            valid_tracking_numbers.append(tracking)
-                            logger.info(f"Found valid {carrier} tracking number: {tracking}")
-                            break
-                    else:
-                        logger.debug(f"Filtered out non-target or invalid tracking number: {tracking}")
-                    checked_numbers.add(tracking)
+            for page, data in enumerate(itertools.chain([first_page], remaining_pages), start=1):
+                if data is None:
+                    break
                 
-                # Determine the shipment ID using camelCase or snake_case
-                shipment_id_value = shipment.get('shipmentId') or shipment.get('shipment_id')
-                if not shipment_id_value:
-                    logger.debug(f"No shipment ID found for shipment: {shipment}")
-                    continue
-
-                # 2. Fetch label-level tracking numbers for this shipment
-                labels = fetch_labels_for_shipment(shipment_id_value, api_key)
-                for label in labels:
-                    track = label.get('tracking_number') or label.get('trackingNumber')
-                    if not track or track in checked_numbers:
+                # Process response
+                shipments = data.get('shipments', [])
+                logger.info("Fetched %s shipments from page %s of %s", len(shipments), page, total_pages)
+                
+                if not shipments:
+                    logger.info("No more shipments to fetch")
+                    break
+                
+                for shipment in shipments:
+                    # Status is read once; cancelled shipments contribute no tracking numbers at all
+                    status = shipment.get('shipment_status')
+                    if status == 'cancelled':
+                        continue
+                    
+                    # Determine the shipment ID (camelCase or snake_case), keeping only the first
+                    # occurrence of a shipment that is repeated across pages
+                    shipment_id = shipment.get('shipmentId') or shipment.get('shipment_id')
+                    if not shipment_id:
+                        logger.debug("No shipment ID found for shipment: %s", shipment)
+                    elif shipment_id in seen_shipment_ids:
                         continue
-                    for carrier in ('UPS', 'USPS', 'DHL'):
-                        pattern = TRACKING_PATTERNS.get(carrier)
-                        if pattern and re.fullmatch(pattern, track):
-                            valid_tracking_numbers.append(track)
-                            logger.info(f"Found valid {carrier} tracking number on label: {track}")
-                            break
                     else:
-                        logger.debug(f"Filtered out non-target or invalid tracking number on label: {track}")
-                    checked_numbers.add(track)
+                        seen_shipment_ids.add(shipment_id)
+                    
+                    # Only shipments with a purchased label have labels to look up
+                    # (a shipment without a status is looked up as before)
+                    label_future = None
+                    if shipment_id and status in (None, 'label_purchased'):
+                        label_future = label_executor.submit(fetch_labels_for_shipment, shipment_id, api_key)
+                    pending_shipments.append((shipment, label_future))
             
-            # Check if we've reached the end
-            if page >= total_pages:
-                break
-            
-            # Move to next page
-            page += 1
-            time.sleep(1)  # Delay to avoid rate limits
+            # Extract tracking numbers in shipment order as the label lookups complete
+            for shipment, label_future in pending_shipments:
+                labels = label_future.result() if label_future else []
+                valid_tracking_numbers.extend(process_shipment(shipment, labels, checked_numbers))
         
-        logger.info(f"Extracted {len(valid_tracking_numbers)} valid tracking numbers")
+        logger.info("Extracted %s valid tracking numbers", len(valid_tracking_numbers))
         return valid_tracking_numbers
     
     except Exception as e:
-        logger.error(f"Error fetching from ShipStation API: {e}")
+        logger.error("Error fetching from ShipStation API: %s", e)
         import traceback
-        logger.error(f"Error details: {traceback.format_exc()}")
+        logger.error("Error details: %s", traceback.format_exc())
         return valid_tracking_numbers
 
 def add_tracking_numbers_to_sheet(sheet, tracking_numbers):
@@ -268,60 +338,34 @@ def add_tracking_numbers_to_sheet(sheet, tracking_numbers):
     try:
         # Get existing tracking numbers
         existing_numbers = get_existing_tracking_numbers(sheet)
-        logger.info(f"Found {len(existing_numbers)} existing tracking numbers in sheet")
+        logger.info("Found %s existing tracking numbers in sheet", len(existing_numbers))
+        
+        # Filter out duplicates, both against the sheet and within this batch (first occurrence wins)
+        new_tracking_numbers = [tn for tn in dict.fromkeys(tracking_numbers) if tn not in existing_numbers]
+        logger.info("Found %s new tracking numbers to add", len(new_tracking_numbers))
         
-        # Filter out duplicates
-        new_tracking_numbers = [tn for tn in tracking_numbers if tn not in existing_numbers]
-        logger.info(f"Found {len(new_tracking_numbers)} new tracking numbers to add")
-
-        # Determine the next available row (accounting for header)
-        next_row = len(existing_numbers) + 2  # +1 for header, +1 to start at next row
         if not existing_numbers:
-            # If sheet is empty, ensure header exists and adjust next_row
-            values = sheet.get_values()
-            if not values or values[0][0].lower() != 'tracking number':
+            # If sheet is empty, ensure header exists (only cell A1 is read)
+            header = sheet.acell('A1').value
+            if not header or header.lower() != 'tracking number':
                 sheet.update('A1', [['Tracking Number']])
                 logger.info("Added header row")
-            next_row = 2
-        
-        # Ensure the sheet has enough rows to accommodate new entries
-        current_rows = sheet.row_count
-        required_rows = next_row + len(new_tracking_numbers) - 1
-        if required_rows > current_rows:
-            try:
-                extra = required_rows - current_rows
-                sheet.add_rows(extra)
-                logger.info(f"Added {extra} extra rows to sheet (now {required_rows} rows total)")
-            except Exception as e:
-                logger.error(f"Failed to expand sheet rows: {e}")
         
         if not new_tracking_numbers:
             logger.info("No new tracking numbers to add")
             return 0
         
-        # Batch updates for efficiency
-        cell_list = []
-        for i, tracking in enumerate(new_tracking_numbers):
-            cell_list.append({'range': f'A{next_row + i}', 'values': [[tracking]]})
-        
-        # Apply updates if we have any
-        if cell_list:
-            # Split into smaller batches to avoid rate limits (max 20 per batch)
-            batch_size = 20
-            for i in range(0, len(cell_list), batch_size):
-                batch = cell_list[i:i+batch_size]
-                sheet.batch_update(batch)
-                logger.info(f"Updated batch of {len(batch)} tracking numbers")
-                time.sleep(1)  # Delay to avoid rate limits
-            
-            logger.info(f"Added {len(new_tracking_numbers)} new tracking numbers to sheet")
+        # Append all new rows in a single request; the Sheets API places them after
+        # the last row in use and grows the sheet as needed
+        sheet.append_rows([[tracking] for tracking in new_tracking_numbers], value_input_option='RAW')
+        logger.info("Added %s new tracking numbers to sheet", len(new_tracking_numbers))
         
         return len(new_tracking_numbers)
     
     except Exception as e:
-        logger.error(f"Error adding tracking numbers to sheet: {e}")
+        logger.error("Error adding tracking numbers to sheet: %s", e)
         import traceback
-        logger.error(f"Error details: {traceback.format_exc()}")
+        logger.error("Error details: %s", traceback.format_exc())
         return 0
 
 def main():
@@ -348,9 +392,9 @@ def main():
         print(f"Added {added_count} new tracking numbers to column A")
         
     except Exception as e:
-        logger.error(f"Error in main function: {e}")
+        logger.error("Error in main function: %s", e)
         import traceback
-        logger.error(f"Error details: {traceback.format_exc()}")
+        logger.error("Error details: %s", traceback.format_exc())
         print(f"Error: {e}")
         print("Check the logs for detailed information.")
 
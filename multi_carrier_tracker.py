@@ -11,11 +11,11 @@ This script:
 
 import os
 import base64
-import json
 import logging
 from datetime import datetime
 import time
 
+import orjson
 import requests
 import gspread
 from google.oauth2.service_account import Credentials
@@ -66,6 +66,22 @@ CARRIER_LOGOS = {
     'UNKNOWN': 'https://upload.wikimedia.org/wikipedia/commons/thumb/8/86/Question_mark_icon.png/1024px-Question_mark_icon.png'
 }
 
+# Minimum spacing between tracking lookups to stay within carrier API rate limits
+TRACKING_INTERVAL = 1.0  # seconds
+_next_lookup_at = 0.0
+
+def wait_for_rate_limit():
+    """
+    Wait until TRACKING_INTERVAL has passed since the previous tracking lookup started.
+    Only the remainder of the interval is slept, so slow lookups incur no extra delay.
+    """
+    global _next_lookup_at
+    now = time.monotonic()
+    if now < _next_lookup_at:
+        time.sleep(_next_lookup_at - now)
+        now = _next_lookup_at
+    _next_lookup_at = now + TRACKING_INTERVAL
+
 def setup_google_sheets():
     """Authenticate with Google Sheets API using service account credentials."""
     try:
@@ -74,8 +90,8 @@ def setup_google_sheets():
             creds = Credentials.from_service_account_file('credentials.json', scopes=SCOPES)
         else:
             # Decode base64-encoded credentials from environment variable
-            credentials_json = base64.b64decode(os.environ['GOOGLE_CREDENTIALS']).decode('utf-8')
-            credentials_info = json.loads(credentials_json)
+            credentials_json = base64.b64decode(os.environ['GOOGLE_CREDENTIALS'])
+            credentials_info = orjson.loads(credentials_json)
             creds = Credentials.from_service_account_info(credentials_info, scopes=SCOPES)
         
         # Connect to Google Sheets
@@ -167,7 +183,7 @@ def get_origin_address():
         "country": "US"  # Default to US
     }
 
-def update_sheet_row(sheet, row, data):
+def update_sheet_row(sheet, row, data, run_time=None):
     """
     Update a row in the Google Sheet with tracking information.
     Uses batch updates to avoid API rate limits.
@@ -176,10 +192,11 @@ def update_sheet_row(sheet, row, data):
         sheet: Google Sheet object
         row: Row number to update
         data: Dict containing update data
+        run_time: Timestamp string for the current run, formatted once by the caller
     """
     try:
         # Add current timestamp to show when the script ran
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        current_time = run_time or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
         # Prepare all updates as a batch
         updates = []
@@ -241,7 +258,7 @@ def update_sheet_row(sheet, row, data):
         import traceback
         logger.error(f"Update error details: {traceback.format_exc()}")
 
-def process_tracking_number(tracking_number, row_index, sheet):
+def process_tracking_number(tracking_number, row_index, sheet, run_time=None):
     """
     Process a single tracking number by detecting carrier and getting tracking info.
     
@@ -249,6 +266,7 @@ def process_tracking_number(tracking_number, row_index, sheet):
         tracking_number (str): The tracking number to process
         row_index (int): The row index in the spreadsheet
         sheet (object): Google Sheet object
+        run_time (str, optional): Timestamp string for the current run
     """
     try:
         # Skip empty tracking numbers
@@ -271,10 +289,11 @@ def process_tracking_number(tracking_number, row_index, sheet):
             
             # Update sheet with just the carrier info
             update_data = {'carrier': carrier or 'UNKNOWN'}
-            update_sheet_row(sheet, row_index, update_data)
+            update_sheet_row(sheet, row_index, update_data, run_time)
             return
         
-        # Get tracking information
+        # Get tracking information, spaced out to avoid API rate limits
+        wait_for_rate_limit()
         track_result = carrier_api.get_tracking_info(tracking_number)
         
         if not track_result:
@@ -282,16 +301,16 @@ def process_tracking_number(tracking_number, row_index, sheet):
             
             # Update sheet with just the carrier info
             update_data = {'carrier': carrier, 'status': 'API Error'}
-            update_sheet_row(sheet, row_index, update_data)
+            update_sheet_row(sheet, row_index, update_data, run_time)
             return
         
         # Extract data from standardized response
-        status = track_result.get('status')
-        last_update = track_result.get('last_update')
-        location = track_result.get('location')
-        address_dict = track_result.get('address')
-        delivery_estimate = track_result.get('delivery_estimate')
-        carrier_name = track_result.get('carrier')
+        status = track_result.status
+        last_update = track_result.last_update
+        location = track_result.location
+        address_dict = track_result.address
+        delivery_estimate = track_result.delivery_estimate
+        carrier_name = track_result.carrier
         
         # Prepare update data
         update_data = {
@@ -338,10 +357,7 @@ def process_tracking_number(tracking_number, row_index, sheet):
                         update_data['estimated_delivery'] = estimated_delivery
         
         # Update sheet with all collected data
-        update_sheet_row(sheet, row_index, update_data)
-        
-        # Small delay to avoid API rate limits
-        time.sleep(1)
+        update_sheet_row(sheet, row_index, update_data, run_time)
         
     except Exception as e:
         logger.error(f"Error processing tracking number {tracking_number}: {e}")
@@ -375,6 +391,9 @@ def main():
         # Start processing from row 2 (skip header)
         start_row = 2
         
+        # Every row updated in this run carries the same timestamp
+        run_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        
         # Process each tracking number
         for i, row in enumerate(all_values[start_row-1:], start=start_row):
             # Skip empty rows
@@ -382,7 +401,7 @@ def main():
                 continue
                 
             tracking_number = row[0].strip()
-            process_tracking_number(tracking_number, i, sheet)
+            process_tracking_number(tracking_number, i, sheet, run_time)
         
         logger.info("Multi-carrier tracking script completed successfully")
     except Exception as e:
@@ -17,7 +17,9 @@ import logging
 from datetime import datetime
 import time
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 import gspread
 from google.oauth2.service_account import Credentials
 
@@ -49,6 +51,31 @@ UPS_TRACK_URL = 'https://onlinetools.ups.com/api/track/v1/details/'
 UPS_ADDRESS_URL = 'https://onlinetools.ups.com/api/addressvalidation/v1/1'
 UPS_TIME_IN_TRANSIT_URL = 'https://onlinetools.ups.com/api/timeintransit/v1'
 
+# Shared UPS session: every tracking number makes several calls to the same host,
+# so keep-alive connections avoid a new TCP+TLS handshake per request
+UPS_SESSION = requests.Session()
+UPS_SESSION.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+# Month names indexed by month number - 1
+MONTH_NAMES = ("January", "February", "March", "April", "May", "June",
+               "July", "August", "September", "October", "November", "December")
+
+# Minimum spacing between tracking lookups to stay within carrier API rate limits
+TRACKING_INTERVAL = 1.0  # seconds
+_next_lookup_at = 0.0
+
+def wait_for_rate_limit():
+    """
+    Wait until TRACKING_INTERVAL has passed since the previous tracking lookup started.
+    Only the remainder of the interval is slept, so slow lookups incur no extra delay.
+    """
+    global _next_lookup_at
+    now = time.monotonic()
+    if now < _next_lookup_at:
+        time.sleep(_next_lookup_at - now)
+        now = _next_lookup_at
+    _next_lookup_at = now + TRACKING_INTERVAL
+
 def setup_google_sheets():
     """Authenticate with Google Sheets API using service account credentials."""
     try:
@@ -57,8 +84,8 @@ def setup_google_sheets():
             creds = Credentials.from_service_account_file('credentials.json', scopes=SCOPES)
         else:
             # Decode base64-encoded credentials from environment variable
-            credentials_json = base64.b64decode(os.environ['GOOGLE_CREDENTIALS']).decode('utf-8')
-            credentials_info = json.loads(credentials_json)
+            credentials_json = base64.b64decode(os.environ['GOOGLE_CREDENTIALS'])
+            credentials_info = orjson.loads(credentials_json)
             creds = Credentials.from_service_account_info(credentials_info, scopes=SCOPES)
         
         # Connect to Google Sheets
@@ -102,7 +129,7 @@ def get_ups_oauth_token():
         logger.info("Sending OAuth token request...")
         
         # Make the request
-        response = requests.post(
+        response = UPS_SESSION.post(
             UPS_OAUTH_URL,
             headers=headers,
             data=data,
@@ -173,7 +200,7 @@ def get_tracking_info(tracking_number, access_token):
         logger.info(f"Sending tracking request for: {tracking_number}")
         
         # Make the request with query parameters
-        response = requests.get(
+        response = UPS_SESSION.get(
             tracking_url, 
             headers=headers,
             params=query_params
@@ -242,7 +269,7 @@ def validate_address(address, access_token):
         logger.info(f"Validation request data: {json.dumps(data)}")
         
         # Make the request
-        response = requests.post(
+        response = UPS_SESSION.post(
             UPS_ADDRESS_URL,
             headers=headers,
             json=data
@@ -335,7 +362,7 @@ def get_time_in_transit(origin, destination, access_token):
         transit_url = "https://onlinetools.ups.com/api/shipments/v1/transittimes"
         
         # Make the request
-        response = requests.post(
+        response = UPS_SESSION.post(
             transit_url,
             headers=headers,
             json=data
@@ -489,9 +516,7 @@ def parse_tracking_response(tracking_data):
                         if len(year) == 2:
                             year = "20" + year  # Assume 21st century
                         
-                        month_names = ["January", "February", "March", "April", "May", "June", 
-                                      "July", "August", "September", "October", "November", "December"]
-                        month_name = month_names[month_num - 1] if 1 <= month_num <= 12 else ""
+                        month_name = MONTH_NAMES[month_num - 1] if 1 <= month_num <= 12 else ""
                         
                         if month_name:
                             delivery_estimate = f"{month_name} {day}, {year}"
@@ -499,7 +524,7 @@ def parse_tracking_response(tracking_data):
                             delivery_estimate = delivery_date
                     else:
                         delivery_estimate = delivery_date
-                except:
+                except (ValueError, IndexError):
                     delivery_estimate = delivery_date
         
         # If we found a delivery estimate, log it
@@ -639,14 +664,12 @@ def format_ups_date(date_str):
             day = date_str[6:8]
             
             # Convert month number to name
-            month_names = ["January", "February", "March", "April", "May", "June", 
-                           "July", "August", "September", "October", "November", "December"]
             try:
                 month_num = int(month)
                 if 1 <= month_num <= 12:
-                    month_name = month_names[month_num - 1]
+                    month_name = MONTH_NAMES[month_num - 1]
                     return f"{month_name} {int(day)}, {year}"
-            except:
+            except ValueError:
                 pass
                 
         # For other formats, return as is
@@ -689,7 +712,7 @@ def format_ups_time(time_str):
         return time_str
 
 # Function to fix Google Sheets update method
-def update_sheet_row(sheet, row, data):
+def update_sheet_row(sheet, row, data, run_time=None):
     """
     Update a row in the Google Sheet with tracking information.
     Uses the current recommended gspread method to avoid deprecation warnings.
@@ -699,10 +722,11 @@ def update_sheet_row(sheet, row, data):
         sheet: Google Sheet object
         row: Row number to update
         data: Dict containing update data
+        run_time: Timestamp string for the current run, formatted once by the caller
     """
     try:
         # Add current timestamp to show when the script ran
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        current_time = run_time or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
         # Prepare all updates as a batch instead of individual calls
         # This also avoids the deprecation warnings
@@ -810,6 +834,9 @@ def main():
         else:
             logger.warning("No origin address provided for time-in-transit calculations")
         
+        # Every row updated in this run carries the same timestamp
+        run_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        
         # Process each tracking number
         for i, row in enumerate(all_values[start_row-1:], start=start_row):
             # Skip empty rows
@@ -819,7 +846,8 @@ def main():
             tracking_number = row[0].strip()
             logger.info(f"Processing tracking number: {tracking_number}")
             
-            # Get tracking information
+            # Get tracking information, spaced out to avoid API rate limits
+            wait_for_rate_limit()
             tracking_info = get_tracking_info(tracking_number, access_token)
             
             # Parse tracking response - now includes delivery_estimate
@@ -858,12 +886,9 @@ def main():
             
             # Update sheet
             if update_data:
-                update_sheet_row(sheet, i, update_data)
+                update_sheet_row(sheet, i, update_data, run_time)
             else:
                 logger.warning(f"No valid tracking information found for {tracking_number}")
-                
-            # Add a small delay to avoid API rate limits
-            time.sleep(1)
             
         logger.info("Tracking script completed successfully")
     except Exception as e: